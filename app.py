@@ -6,6 +6,7 @@ import numpy as np
 import streamlit as st
 import plotly.express as px
 
+from src.data_loading import load_data as _load_sales_csv
 from src.data_preprocessing import preprocess_sales
 from src.visualization import (
     plot_monthly_revenue,
@@ -44,107 +45,9 @@ st.markdown(
 
 @st.cache_data
 def load_data():
-    """
-    Locate and load Sales.csv from common locations.
-
-    This cached function only attempts to read CSV files from disk (no
-    Streamlit widgets) so it's safe to cache. If no file is found an
-    empty DataFrame is returned and the caller should prompt for upload.
-    """
-    import logging
-    import os
-    import re
-
-    logger = logging.getLogger(__name__)
-
-    cwd = os.getcwd()
-    candidates = [
-        os.path.join(cwd, "data", "Sales.csv"),
-        os.path.join(cwd, "data", "sales.csv"),
-        "/Users/krishnarawat/Desktop/Data Science/sales.csv",
-        os.path.join(cwd, "Sales.csv"),
-        os.path.join(cwd, "sales.csv"),
-        os.path.join(os.path.dirname(__file__), "..", "Sales.csv"),
-    ]
-
-    df = None
-    for p in candidates:
-        try:
-            if os.path.exists(p):
-                # Try fast, strict read first (C engine). Do NOT pass parse_dates
-                # until we've normalized column names.
-                try:
-                    df = pd.read_csv(p, low_memory=False)
-                except Exception:
-                    # Fallback: use python engine and skip malformed lines
-                    try:
-                        df = pd.read_csv(p, engine="python", on_bad_lines="skip", skipinitialspace=True)
-                    except TypeError:
-                        # Older pandas: use error_bad_lines / warn_bad_lines
-                        df = pd.read_csv(p, engine="python", error_bad_lines=False, warn_bad_lines=True, skipinitialspace=True)
-                df_path = p
-                break
-        except Exception:
-            logger.exception("Failed reading candidate CSV: %s", p)
-
-    # If no file found on disk return empty DataFrame to let caller handle upload
-    if df is None:
-        return pd.DataFrame()
-
-    # Strip whitespace from column names
-    try:
-        df.columns = df.columns.astype(str).str.strip()
-    except Exception:
-        logger.exception("Failed to normalize column names")
-
-    # Heuristic to find a date-like column
-    chosen = None
-    if "Date" in df.columns:
-        chosen = "Date"
-    else:
-        pattern = re.compile(r"date|time", re.I)
-        matches = [c for c in df.columns if pattern.search(c)]
-        if matches:
-            chosen = matches[0]
-
-    # If not found by name, try to infer by parsing a sample of each column
-    if chosen is None:
-        best_col = None
-        best_parsed = 0
-        for col in df.columns:
-            try:
-                sample = df[col].dropna().astype(str).head(500)
-                if sample.empty:
-                    continue
-                parsed = pd.to_datetime(sample, errors="coerce", infer_datetime_format=True)
-                n_parsed = int(parsed.notna().sum())
-                if n_parsed > best_parsed:
-                    best_parsed = n_parsed
-                    best_col = col
-            except Exception:
-                continue
-        # require at least some reasonable fraction to accept the column
-        if best_col is not None and best_parsed >= max(1, int(0.5 * min(500, len(df)))):
-            chosen = best_col
-
-    # If still not found, return raw df (caller may upload or handle)
-    if chosen is None:
-        return df
-
-    # Convert chosen column to datetime safely
-    try:
-        df[chosen] = pd.to_datetime(df[chosen], dayfirst=False, errors="coerce", infer_datetime_format=True)
-    except Exception:
-        logger.exception("Failed to convert column %s to datetime", chosen)
-
-    # Rename to `Date` for downstream consistency
-    if chosen != "Date":
-        try:
-            df.rename(columns={chosen: "Date"}, inplace=True)
-        except Exception:
-            logger.exception("Failed to rename date column %s to 'Date'", chosen)
+    """Cached wrapper around :func:`src.data_loading.load_data`."""
+    return _load_sales_csv()
 
-    return df
 
 # Load and preprocess
 raw = load_data()
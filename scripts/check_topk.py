@@ -0,0 +1,60 @@
+"""Sanity checks for src/topk.py against plain pandas groupby results.
+
+Run from the project root: python scripts/check_topk.py
+"""
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.topk import GroupedTopKSketch, TopKSketch, top_k_sums  # noqa: E402
+
+rng = np.random.default_rng(0)
+n = 50000
+df = pd.DataFrame({
+    'Product_Category': rng.choice(['Bikes', 'Clothing', 'Accessories'], n),
+    'Product': rng.zipf(1.5, n).astype(str),
+    'Revenue': rng.integers(1, 500, n),
+})
+expected = df.groupby('Product')['Revenue'].sum()
+chunks = np.array_split(np.arange(n), 10)
+
+# top_k_sums is exact and keeps the integer dtype
+top = top_k_sums(df, 'Product', 'Revenue', k=10)
+assert top['Revenue'].dtype == df['Revenue'].dtype
+assert top['Revenue'].tolist() == expected.sort_values(ascending=False).head(10).tolist()
+
+# merged exact sketches reproduce groupby().sum() for every key
+merged = TopKSketch()
+for idx in chunks:
+    merged.merge(TopKSketch().update(df['Product'].iloc[idx], df['Revenue'].iloc[idx]))
+got = pd.Series(merged.values, index=merged.keys).sort_index()
+assert merged.exact and np.array_equal(got.to_numpy(), expected.sort_index().to_numpy().astype('float64'))
+assert got.index.tolist() == expected.sort_index().index.tolist()
+
+# merged exact grouped sketches match the per-category groupby
+grouped = GroupedTopKSketch()
+for idx in chunks:
+    part = df.iloc[idx]
+    grouped.merge(GroupedTopKSketch().update(part['Product_Category'], part['Product'], part['Revenue']))
+per_cat = df.groupby(['Product_Category', 'Product'])['Revenue'].sum()
+for cat, sketch in grouped.sketches.items():
+    assert np.array_equal(pd.Series(sketch.values, index=sketch.keys).sort_index().to_numpy(),
+                          per_cat.loc[cat].sort_index().to_numpy().astype('float64'))
+
+# bounded sketches: error <= total / (capacity + 1) and true totals within [value, value + error]
+capacity = 50
+bounded = TopKSketch(capacity)
+for idx in chunks:
+    bounded.merge(TopKSketch(capacity).update(df['Product'].iloc[idx], df['Revenue'].iloc[idx]))
+assert bounded.error <= bounded.total / (capacity + 1)
+top = bounded.top(10)
+true = expected.reindex(top['key']).to_numpy()
+assert ((true >= top['value'].to_numpy()) & (true <= top['value'].to_numpy() + bounded.error)).all()
+heavy = expected[expected > bounded.total / (capacity + 1)].index
+assert set(heavy) <= set(bounded.keys)
+
+print('topk checks passed')
@@ -0,0 +1,243 @@
+"""Headless batch report generator.
+
+Renders a selection of the dashboard charts plus KPI tables for every
+combination of the chosen filter columns (e.g. Country x Year) to static
+HTML/JSON, without going through Streamlit::
+
+    python -m src.batch_reports --by Country Year --out reports
+
+The dataset is loaded and preprocessed once in the parent process; KPIs for
+all variants come from a single groupby, per-variant top products from one
+pass of per-variant top-k sketches, and chart rendering is spread over a
+process pool whose workers each receive the frame once.
+"""
+import argparse
+import datetime
+import hashlib
+import html
+import json
+import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.data_loading import load_data
+from src.data_preprocessing import preprocess_sales
+from src.topk import GroupedTopKSketch, TopKSketch
+from src.visualization import (
+    plot_monthly_revenue,
+    plot_top_products,
+    plot_revenue_by_country,
+    plot_profit_box,
+    plot_category_heatmap,
+    plot_treemap_top_products,
+    plot_country_choropleth,
+)
+
+logger = logging.getLogger(__name__)
+
+# Same charts and arguments as the dashboard in app.py
+CHARTS = {
+    'monthly_revenue': plot_monthly_revenue,
+    'top_products': lambda df: plot_top_products(df, top_n=10),
+    'revenue_by_country': plot_revenue_by_country,
+    'profit_box': plot_profit_box,
+    'category_heatmap': lambda df: plot_category_heatmap(df, agg_col='Revenue'),
+    'treemap_top_products': lambda df: plot_treemap_top_products(df, top_n=40),
+    'country_choropleth': lambda df: plot_country_choropleth(df, agg_col='Revenue'),
+}
+
+# Rows in the per-report top products table
+TOP_PRODUCTS = 10
+
+# Worker-process state, filled once per worker by _init_worker
+_WORKER = {}
+
+
+def _plain(value):
+    """Convert numpy scalars and timestamps to JSON-friendly Python values."""
+    if isinstance(value, np.datetime64):
+        value = pd.Timestamp(value)
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if hasattr(value, 'item'):
+        value = value.item()
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return value
+
+
+def _slug(filters: dict) -> str:
+    if not filters:
+        return 'all'
+    parts = [f"{k}-{v}" for k, v in filters.items()]
+    # sanitising can map distinct values to the same name, so add a short hash
+    digest = hashlib.sha1(json.dumps(filters, sort_keys=True).encode('utf-8')).hexdigest()[:8]
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', '__'.join(parts)) + f'__{digest}'
+
+
+def compute_kpis(df: pd.DataFrame, by) -> pd.DataFrame:
+    """KPI table (as shown on the dashboard) for the whole frame and every `by` group."""
+    def _finish(agg):
+        agg['Avg_Order_Value'] = agg['Total_Revenue'] / agg['Rows'].clip(lower=1)
+        return agg
+
+    spec = dict(
+        Total_Revenue=('Revenue', 'sum'),
+        Total_Profit=('Profit', 'sum'),
+        Total_Orders=('Order_Quantity', 'sum'),
+        Rows=('Revenue', 'size'),
+    )
+    per_group = _finish(df.groupby(list(by), observed=True).agg(**spec).reset_index())
+    total = _finish(df.assign(_all=0).groupby('_all').agg(**spec).reset_index(drop=True))
+    for col in by:
+        total[col] = 'All'
+    return pd.concat([total[per_group.columns], per_group], ignore_index=True)
+
+
+def top_products_by_variant(df: pd.DataFrame, variant_idx, n=TOP_PRODUCTS):
+    """Top-n products by revenue for every variant, plus overall, in one pass.
+
+    `variant_idx` is a list of row-position arrays, one per variant. Returns a
+    list with the overall table first, then one table per variant, each as
+    JSON-ready records.
+    """
+    if 'Product' not in df.columns:
+        return [[] for _ in range(len(variant_idx) + 1)]
+    variant = np.full(len(df), -1, dtype='int64')  # -1: rows outside every variant
+    for i, idx in enumerate(variant_idx):
+        variant[idx] = i
+    sketch = GroupedTopKSketch().update(variant, df['Product'], df['Revenue'])
+    overall = TopKSketch()
+    for part in sketch.sketches.values():
+        overall.merge(part)
+
+    def _records(s):
+        if s is None:
+            return []
+        top = s.top(n, key='Product', value='Revenue')
+        return [{k: _plain(v) for k, v in rec.items()} for rec in top.to_dict('records')]
+
+    return [_records(overall)] + [_records(sketch.sketches.get(i)) for i in range(len(variant_idx))]
+
+
+def _init_worker(df, chart_names, out_dir, formats):
+    _WORKER.update(df=df, chart_names=chart_names, out_dir=out_dir, formats=formats)
+
+
+def _render_variant(task):
+    """Render one report variant in a worker; returns its manifest entry."""
+    filters, idx, kpis, top_products = task
+    df = _WORKER['df']
+    subset = df if idx is None else df.take(idx)
+    figs = {name: CHARTS[name](subset) for name in _WORKER['chart_names']}
+    slug = _slug(filters)
+    out_dir = _WORKER['out_dir']
+    files = []
+    if 'json' in _WORKER['formats']:
+        path = os.path.join(out_dir, f'{slug}.json')
+        payload = {
+            'filters': filters,
+            'kpis': kpis,
+            'top_products': top_products,
+            'charts': {name: json.loads(fig.to_json()) for name, fig in figs.items()},
+        }
+        with open(path, 'w') as f:
+            json.dump(payload, f)
+        files.append(path)
+    if 'html' in _WORKER['formats']:
+        path = os.path.join(out_dir, f'{slug}.html')
+        title = html.escape(', '.join(f'{k}: {v}' for k, v in filters.items()) or 'All data')
+        kpi_html = pd.DataFrame([kpis]).to_html(index=False, float_format=lambda x: f'{x:,.2f}')
+        if top_products:
+            kpi_html += pd.DataFrame(top_products).to_html(index=False, float_format=lambda x: f'{x:,.2f}')
+        charts_html = [
+            fig.to_html(full_html=False, include_plotlyjs='cdn' if i == 0 else False)
+            for i, fig in enumerate(figs.values())
+        ]
+        with open(path, 'w') as f:
+            f.write(f"<html><head><meta charset='utf-8'><title>{title}</title></head><body>")
+            f.write(f"<h1>Bike Sales Report — {title}</h1>{kpi_html}")
+            f.write(''.join(charts_html))
+            f.write('</body></html>')
+        files.append(path)
+    return {'filters': filters, 'files': files}
+
+
+def generate_reports(df: pd.DataFrame, by=('Country', 'Year'), charts=None, out_dir='reports',
+                     formats=('html', 'json'), workers=None):
+    """Render one report per combination of `by` values (plus an overall one).
+
+    `df` must already be preprocessed. Returns the manifest written to
+    ``index.json`` in `out_dir`.
+    """
+    by = list(by)
+    chart_names = list(charts or CHARTS)
+    unknown = [c for c in chart_names if c not in CHARTS]
+    if unknown:
+        raise ValueError(f"Unknown chart(s): {', '.join(unknown)}")
+    missing = [c for c in by if c not in df.columns]
+    if missing:
+        raise ValueError(f"Filter column(s) not in data: {', '.join(missing)}")
+    os.makedirs(out_dir, exist_ok=True)
+
+    kpis = compute_kpis(df, by)
+    kpi_records = [{k: _plain(v) for k, v in rec.items()} for rec in kpis.to_dict('records')]
+    kpis.to_html(os.path.join(out_dir, 'kpis.html'), index=False)
+    with open(os.path.join(out_dir, 'kpis.json'), 'w') as f:
+        json.dump(kpi_records, f)
+
+    # Row positions of every variant from a single pass over the data
+    groups = df.groupby(by, observed=True).indices
+    kpi_by_key = {tuple(rec[col] for col in by): rec for rec in kpi_records[1:]}
+    tasks = [({}, None, kpi_records[0])]
+    for key, idx in groups.items():
+        key = tuple(_plain(v) for v in (key if isinstance(key, tuple) else (key,)))
+        tasks.append((dict(zip(by, key)), idx, kpi_by_key[key]))
+    top_products = top_products_by_variant(df, [t[1] for t in tasks[1:]])
+    tasks = [task + (top,) for task, top in zip(tasks, top_products)]
+
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(tasks) // (workers * 4))
+    if workers == 1:
+        _init_worker(df, chart_names, out_dir, formats)
+        entries = [_render_variant(t) for t in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=(df, chart_names, out_dir, formats)) as pool:
+            entries = list(pool.map(_render_variant, tasks, chunksize=chunksize))
+
+    manifest = {'by': by, 'charts': chart_names, 'reports': entries}
+    with open(os.path.join(out_dir, 'index.json'), 'w') as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render static dashboard reports for many filter combinations.')
+    parser.add_argument('--input', help='Path to Sales.csv (default: same locations as the dashboard)')
+    parser.add_argument('--by', nargs='+', default=['Country', 'Year'], help='Columns whose value combinations each get a report')
+    parser.add_argument('--charts', nargs='+', choices=sorted(CHARTS), help='Charts to render (default: all)')
+    parser.add_argument('--format', nargs='+', dest='formats', choices=['html', 'json'], default=['html', 'json'])
+    parser.add_argument('--out', default='reports', help='Output directory')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    raw = load_data([args.input] if args.input else None)
+    if raw.empty:
+        parser.error('Sales.csv not found. Pass --input or place it in the data/ folder.')
+    df = preprocess_sales(raw)
+    if 'Date' not in df.columns or df['Date'].isna().all():
+        parser.error('No valid `Date` column found after parsing.')
+
+    manifest = generate_reports(df, by=args.by, charts=args.charts, out_dir=args.out,
+                                formats=args.formats, workers=args.workers)
+    logger.info("Wrote %d reports to %s", len(manifest['reports']), args.out)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+import logging
+import os
+import re
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Directory holding app.py; the loader also looks one level above it.
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def default_candidates():
+    """Paths searched for Sales.csv, in order of preference."""
+    cwd = os.getcwd()
+    return [
+        os.path.join(cwd, "data", "Sales.csv"),
+        os.path.join(cwd, "data", "sales.csv"),
+        "/Users/krishnarawat/Desktop/Data Science/sales.csv",
+        os.path.join(cwd, "Sales.csv"),
+        os.path.join(cwd, "sales.csv"),
+        os.path.join(PROJECT_ROOT, "..", "Sales.csv"),
+    ]
+
+
+def load_data(candidates=None):
+    """
+    Locate and load Sales.csv from common locations.
+
+    Only reads CSV files from disk (no Streamlit widgets) so callers are free
+    to cache it. If no file is found an empty DataFrame is returned and the
+    caller should prompt for upload. Pass ``candidates`` to search specific
+    paths instead of :func:`default_candidates`.
+    """
+    if candidates is None:
+        candidates = default_candidates()
+
+    df = None
+    for p in candidates:
+        try:
+            if os.path.exists(p):
+                # Try fast, strict read first (C engine). Do NOT pass parse_dates
+                # until we've normalized column names.
+                try:
+                    df = pd.read_csv(p, low_memory=False)
+                except Exception:
+                    # Fallback: use python engine and skip malformed lines
+                    try:
+                        df = pd.read_csv(p, engine="python", on_bad_lines="skip", skipinitialspace=True)
+                    except TypeError:
+                        # Older pandas: use error_bad_lines / warn_bad_lines
+                        df = pd.read_csv(p, engine="python", error_bad_lines=False, warn_bad_lines=True, skipinitialspace=True)
+                df_path = p
+                break
+        except Exception:
+            logger.exception("Failed reading candidate CSV: %s", p)
+
+    # If no file found on disk return empty DataFrame to let caller handle upload
+    if df is None:
+        return pd.DataFrame()
+
+    # Strip whitespace from column names
+    try:
+        df.columns = df.columns.astype(str).str.strip()
+    except Exception:
+        logger.exception("Failed to normalize column names")
+
+    # Heuristic to find a date-like column
+    chosen = None
+    if "Date" in df.columns:
+        chosen = "Date"
+    else:
+        pattern = re.compile(r"date|time", re.I)
+        matches = [c for c in df.columns if pattern.search(c)]
+        if matches:
+            chosen = matches[0]
+
+    # If not found by name, try to infer by parsing a sample of each column
+    if chosen is None:
+        best_col = None
+        best_parsed = 0
+        for col in df.columns:
+            try:
+                sample = df[col].dropna().astype(str).head(500)
+                if sample.empty:
+                    continue
+                parsed = pd.to_datetime(sample, errors="coerce", infer_datetime_format=True)
+                n_parsed = int(parsed.notna().sum())
+                if n_parsed > best_parsed:
+                    best_parsed = n_parsed
+                    best_col = col
+            except Exception:
+                continue
+        # require at least some reasonable fraction to accept the column
+        if best_col is not None and best_parsed >= max(1, int(0.5 * min(500, len(df)))):
+            chosen = best_col
+
+    # If still not found, return raw df (caller may upload or handle)
+    if chosen is None:
+        return df
+
+    # Convert chosen column to datetime safely
+    try:
+        df[chosen] = pd.to_datetime(df[chosen], dayfirst=False, errors="coerce", infer_datetime_format=True)
+    except Exception:
+        logger.exception("Failed to convert column %s to datetime", chosen)
+
+    # Rename to `Date` for downstream consistency
+    if chosen != "Date":
+        try:
+            df.rename(columns={chosen: "Date"}, inplace=True)
+        except Exception:
+            logger.exception("Failed to rename date column %s to 'Date'", chosen)
+
+    return df
@@ -0,0 +1,183 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+
+class FeaturePipeline:
+    """Turn a preprocessed sales frame into a compact float32 design matrix.
+
+    Numeric features pass through, datetimes become days since epoch, and
+    everything else (``Country``, ``Product_Category``, ``Age_Group``,
+    ``Month_Name``...) is encoded with category mappings learned in
+    :meth:`fit` and reused by every later :meth:`transform`.
+
+    ``encoding='ordinal'`` yields a dense matrix with one column per feature
+    (unseen categories map to -1); ``encoding='onehot'`` yields a scipy CSR
+    matrix so wide categoricals never get densified.
+
+    ``lags``/``rolling`` add revenue history per ``lag_by`` group on the
+    ``Month_Year`` calendar: the group's total ``lag_value`` k months earlier
+    and the mean over the previous w months (the current month is never
+    included, so the target does not leak). Near the start of the data the
+    mean is taken over the months actually available. The monthly totals seen
+    in :meth:`fit` are kept, so a later :meth:`transform` on new rows only
+    (e.g. next month's orders) still sees the training history; the new
+    frame's own totals fill in months and groups the fitted history lacks.
+    Months already seen in fit keep their fitted totals until
+    :meth:`update_history` is called with a refreshed frame. Every lag k and
+    window w must be an integer >= 1.
+    """
+
+    def __init__(self, features, encoding='ordinal', lags=(), rolling=(), lag_by=('Country',),
+                 lag_value='Revenue'):
+        if encoding not in ('ordinal', 'onehot'):
+            raise ValueError("encoding must be 'ordinal' or 'onehot'")
+        for name, steps in (('lags', lags), ('rolling', rolling)):
+            if not all(isinstance(k, (int, np.integer)) and not isinstance(k, bool) and k >= 1 for k in steps):
+                raise ValueError(f'{name} must contain integers >= 1')
+        self.features = list(features)
+        self.encoding = encoding
+        self.lags = tuple(lags)
+        self.rolling = tuple(rolling)
+        self.lag_by = list(lag_by)
+        self.lag_value = lag_value
+        self.categories_ = None
+        self.history_ = None
+        self.feature_names_ = None
+
+    @property
+    def fitted(self):
+        return self.categories_ is not None
+
+    def fit(self, df: pd.DataFrame):
+        self.categories_ = {}
+        for col in self.features:
+            s = df[col]
+            if pd.api.types.is_numeric_dtype(s) or pd.api.types.is_datetime64_any_dtype(s):
+                continue
+            if isinstance(s.dtype, pd.CategoricalDtype):
+                self.categories_[col] = pd.Index(s.cat.categories)
+            else:
+                self.categories_[col] = pd.Index(pd.unique(s.dropna()))
+        if self.lags or self.rolling:
+            self.history_ = self._monthly_totals(df)
+        return self
+
+    def transform(self, df: pd.DataFrame):
+        if not self.fitted:
+            raise RuntimeError('FeaturePipeline must be fitted before transform')
+        n = len(df)
+        dense_cols, dense_names = [], []
+        onehot_blocks, onehot_names = [], []
+        for col in self.features:
+            s = df[col]
+            if col not in self.categories_:
+                if pd.api.types.is_datetime64_any_dtype(s):
+                    values = (s - pd.Timestamp(0)).dt.days.to_numpy(dtype='float32', na_value=0)
+                else:
+                    values = pd.to_numeric(s, errors='coerce').to_numpy(dtype='float32', na_value=0)
+                dense_cols.append(values)
+                dense_names.append(col)
+                continue
+            cats = self.categories_[col]
+            codes = cats.get_indexer(s)
+            if self.encoding == 'ordinal':
+                dense_cols.append(codes.astype('float32'))
+                dense_names.append(col)
+            else:
+                rows = np.flatnonzero(codes >= 0)
+                block = sparse.csr_matrix(
+                    (np.ones(rows.size, dtype='float32'), (rows, codes[rows])), shape=(n, len(cats))
+                )
+                onehot_blocks.append(block)
+                onehot_names.extend(f'{col}={c}' for c in cats)
+        for name, values in self._lag_features(df):
+            dense_cols.append(values)
+            dense_names.append(name)
+
+        dense = np.column_stack(dense_cols) if dense_cols else np.empty((n, 0), dtype='float32')
+        self.feature_names_ = dense_names + onehot_names
+        if self.encoding == 'ordinal':
+            return dense
+        return sparse.hstack([sparse.csr_matrix(dense)] + onehot_blocks, format='csr', dtype='float32')
+
+    def fit_transform(self, df: pd.DataFrame):
+        return self.fit(df).transform(df)
+
+    def update_history(self, df: pd.DataFrame):
+        """Replace the fitted monthly totals for every (group, month) present in `df`.
+
+        Use this when rows arrive for months already seen in :meth:`fit`
+        (e.g. a partial last month that has since filled in); encoders are
+        left untouched.
+        """
+        if not self.fitted:
+            raise RuntimeError('FeaturePipeline must be fitted before update_history')
+        if self.lags or self.rolling:
+            totals = self._monthly_totals(df)
+            if self.history_ is None:
+                self.history_ = totals
+            else:
+                self.history_ = pd.concat([self.history_[~self.history_.index.isin(totals.index)], totals])
+        return self
+
+    def _monthly_totals(self, df: pd.DataFrame) -> pd.Series:
+        """Total ``lag_value`` per (``lag_by``..., absolute month number)."""
+        months = pd.to_datetime(df['Month_Year'], format='%Y-%m', errors='coerce')
+        frame = df[self.lag_by].copy()
+        frame['_month'] = months.dt.year * 12 + months.dt.month - 1
+        frame['_value'] = pd.to_numeric(df[self.lag_value], errors='coerce').fillna(0).to_numpy()
+        return frame.groupby(self.lag_by + ['_month'], observed=True)['_value'].sum()
+
+    def _lag_features(self, df: pd.DataFrame):
+        """Yield (name, float32 column) for each configured lag/rolling window."""
+        if not (self.lags or self.rolling):
+            return
+        totals = self._monthly_totals(df)
+        if self.history_ is not None:
+            # fitted totals win for cells they cover, so re-transforming the
+            # training frame does not double count
+            totals = pd.concat([self.history_, totals[~totals.index.isin(self.history_.index)]])
+        if totals.empty:
+            for name in self._lag_names():
+                yield name, np.zeros(len(df), dtype='float32')
+            return
+
+        # (group x month) grid of totals, months contiguous so gaps count as zero sales
+        n_keys = len(self.lag_by)
+        group_keys = pd.MultiIndex.from_arrays([totals.index.get_level_values(i) for i in range(n_keys)])
+        g_codes, g_uniques = pd.factorize(group_keys)
+        months = totals.index.get_level_values(-1).to_numpy(dtype='int64')
+        base = months.min()
+        n_groups, n_months = len(g_uniques), int(months.max() - base) + 1
+        grid = np.zeros((n_groups, n_months))
+        grid[g_codes, months - base] = totals.to_numpy()
+        # csum[:, j] = total of months before j
+        csum = np.zeros((n_groups, n_months + 1))
+        np.cumsum(grid, axis=1, out=csum[:, 1:])
+
+        g = g_uniques.get_indexer(pd.MultiIndex.from_arrays([df[c] for c in self.lag_by]))
+        row_months = pd.to_datetime(df['Month_Year'], format='%Y-%m', errors='coerce')
+        m = (row_months.dt.year * 12 + row_months.dt.month - 1 - base).to_numpy(dtype='float64', na_value=-1)
+        valid = (g >= 0) & (m >= 0) & (m < n_months)
+        m = m.astype('int64')
+
+        def _rows(table):
+            out = np.zeros(len(df), dtype='float32')
+            out[valid] = table[g[valid], m[valid]]
+            return out
+
+        for k in self.lags:
+            lagged = np.zeros_like(grid)
+            if k < n_months:
+                lagged[:, k:] = grid[:, :n_months - k]
+            yield f'{self.lag_value}_lag{k}', _rows(lagged)
+        for w in self.rolling:
+            end = np.arange(n_months)
+            start = np.maximum(end - w, 0)
+            # average only over months that exist in the data; the first month has none
+            window = (csum[:, end] - csum[:, start]) / np.maximum(end - start, 1)
+            yield f'{self.lag_value}_roll{w}', _rows(window)
+
+    def _lag_names(self):
+        return [f'{self.lag_value}_lag{k}' for k in self.lags] + [f'{self.lag_value}_roll{w}' for w in self.rolling]
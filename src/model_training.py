@@ -3,14 +3,27 @@ from sklearn.model_selection import train_test_split
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.metrics import r2_score, mean_absolute_error
 
+from src.feature_engineering import FeaturePipeline
 
-def train_simple_revenue_model(df: pd.DataFrame, features, target='Revenue'):
-    df = df.copy()
+
+def train_simple_revenue_model(df: pd.DataFrame, features, target='Revenue', pipeline=None):
+    """Fit a random forest on `features`, encoding categoricals via a FeaturePipeline.
+
+    Pass a (possibly already fitted) `pipeline` to choose the encoding or add
+    lag/rolling features (its own feature list then replaces `features`); a
+    fitted pipeline's encoders are reused as-is, while its lag history is
+    refreshed from `df` so months that have grown since it was fitted are not
+    left at their old totals. The pipeline used is available afterwards as
+    ``model.feature_pipeline``.
+    """
     df = df.dropna(subset=[target])
-    X = df[features].select_dtypes(include=['number']).fillna(0)
-    y = df[target]
+    if pipeline is None:
+        pipeline = FeaturePipeline(features)
+    X = pipeline.update_history(df).transform(df) if pipeline.fitted else pipeline.fit_transform(df)
+    y = df[target].to_numpy()
     X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
     model = RandomForestRegressor(n_estimators=50, random_state=42)
     model.fit(X_train, y_train)
+    model.feature_pipeline = pipeline
     preds = model.predict(X_test)
     return model, {'r2': r2_score(y_test, preds), 'mae': mean_absolute_error(y_test, preds)}
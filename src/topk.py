@@ -0,0 +1,132 @@
+import numpy as np
+import pandas as pd
+
+
+def top_k_indices(values, k):
+    """Indices of the k largest values, largest first, using a partial sort."""
+    values = np.asarray(values)
+    if k <= 0 or values.size == 0:
+        return np.array([], dtype=np.intp)
+    if k < values.size:
+        idx = np.argpartition(values, values.size - k)[values.size - k:]
+    else:
+        idx = np.arange(values.size)
+    # only the k survivors get fully sorted
+    return idx[np.argsort(-values[idx], kind='stable')]
+
+
+def _sum_by_key(keys, weights):
+    """Per-key sums of weights via factorize + bincount (O(n), no sort)."""
+    codes, uniques = pd.factorize(pd.Series(keys), sort=False)
+    weights = pd.to_numeric(pd.Series(weights), errors='coerce').to_numpy(dtype='float64', na_value=0.0)
+    mask = codes >= 0  # factorize marks missing keys with -1; groupby drops them too
+    if not mask.all():
+        codes = codes[mask]
+        weights = weights[mask]
+    sums = np.bincount(codes, weights=weights, minlength=len(uniques))
+    return np.asarray(uniques, dtype=object), sums
+
+
+def top_k_sums(df: pd.DataFrame, key: str, value: str = 'Revenue', k: int = 10) -> pd.DataFrame:
+    """Exact top-k of ``df.groupby(key)[value].sum()`` without sorting every key."""
+    if df.empty or key not in df.columns:
+        return pd.DataFrame(columns=[key, value])
+    uniques, sums = _sum_by_key(df[key], df[value])
+    idx = top_k_indices(sums, k)
+    top = sums[idx]
+    if pd.api.types.is_integer_dtype(df[value]):
+        # keep integer revenue integer, as groupby().sum() would
+        top = pd.array(top.round(), dtype=df[value].dtype)
+    return pd.DataFrame({key: uniques[idx], value: top})
+
+
+class TopKSketch:
+    """Mergeable heavy-hitter summary of per-key weighted sums.
+
+    With ``capacity=None`` every key is kept and results are exact. With a
+    capacity, updates and merges follow weighted Misra-Gries: whenever more
+    than ``capacity`` counters exist, the (capacity+1)-th largest value is
+    subtracted from every counter and counters at or below zero are dropped.
+    Reported values are lower bounds, the true total of any key is at most
+    ``value + error``, and ``error <= total / (capacity + 1)``. So every key
+    holding more than that share of the total weight is kept. Weights are
+    assumed non-negative (e.g. revenue).
+    """
+
+    def __init__(self, capacity=None):
+        if capacity is not None and capacity < 1:
+            raise ValueError('capacity must be a positive integer or None')
+        self.capacity = capacity
+        self.keys = np.array([], dtype=object)
+        self.values = np.array([], dtype='float64')
+        self.error = 0.0
+        self.total = 0.0
+
+    @property
+    def exact(self):
+        return self.capacity is None or self.error == 0.0
+
+    def _absorb(self, keys, values):
+        if self.keys.size:
+            keys = np.concatenate([self.keys, keys])
+            values = np.concatenate([self.values, values])
+            codes, uniques = pd.factorize(pd.Series(keys, dtype=object), sort=False)
+            values = np.bincount(codes, weights=values, minlength=len(uniques))
+            keys = np.asarray(uniques, dtype=object)
+        if self.capacity is not None and keys.size > self.capacity:
+            cut = keys.size - self.capacity - 1
+            threshold = float(np.partition(values, cut)[cut])
+            values = values - threshold
+            keep = values > 0
+            keys, values = keys[keep], values[keep]
+            self.error += threshold
+        self.keys, self.values = keys, values
+        return self
+
+    def update(self, keys, weights):
+        """Fold a chunk of (key, weight) rows into the sketch."""
+        chunk_keys, chunk_sums = _sum_by_key(keys, weights)
+        self.total += float(chunk_sums.sum())
+        return self._absorb(chunk_keys, chunk_sums)
+
+    def merge(self, other: 'TopKSketch'):
+        """Combine another sketch (e.g. built on a different chunk) into this one."""
+        self.error += other.error
+        self.total += other.total
+        return self._absorb(other.keys, other.values)
+
+    def top(self, n=10, key='key', value='value') -> pd.DataFrame:
+        """Current top-n keys as a DataFrame, largest first."""
+        idx = top_k_indices(self.values, n)
+        return pd.DataFrame({key: self.keys[idx], value: self.values[idx]})
+
+
+class GroupedTopKSketch:
+    """One :class:`TopKSketch` per group (e.g. per ``Product_Category``)."""
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.sketches = {}
+
+    def update(self, groups, keys, weights):
+        frame = pd.DataFrame({'g': np.asarray(groups), 'k': np.asarray(keys), 'w': np.asarray(weights)})
+        for group, part in frame.groupby('g', sort=False, observed=True):
+            sketch = self.sketches.setdefault(group, TopKSketch(self.capacity))
+            sketch.update(part['k'], part['w'])
+        return self
+
+    def merge(self, other: 'GroupedTopKSketch'):
+        for group, sketch in other.sketches.items():
+            self.sketches.setdefault(group, TopKSketch(self.capacity)).merge(sketch)
+        return self
+
+    def top(self, n=10, group='group', key='key', value='value') -> pd.DataFrame:
+        """Top-n keys within every group, stacked into one DataFrame."""
+        frames = []
+        for g, sketch in self.sketches.items():
+            part = sketch.top(n, key=key, value=value)
+            part.insert(0, group, g)
+            frames.append(part)
+        if not frames:
+            return pd.DataFrame(columns=[group, key, value])
+        return pd.concat(frames, ignore_index=True)
@@ -1,6 +1,8 @@
 import plotly.express as px
 import pandas as pd
 
+from src.topk import top_k_sums
+
 # Ducati-inspired palette
 PALETTE = {
     "primary": "#D71A14",
@@ -31,7 +33,7 @@ def plot_monthly_revenue(df: pd.DataFrame):
 def plot_top_products(df: pd.DataFrame, top_n=10):
     if df.empty or 'Product' not in df.columns:
         return px.bar()
-    prod = df.groupby('Product', as_index=False)['Revenue'].sum().sort_values('Revenue', ascending=False).head(top_n)
+    prod = top_k_sums(df, 'Product', 'Revenue', k=top_n)
     fig = px.bar(
         prod,
         x='Revenue',
@@ -92,10 +94,10 @@ def plot_treemap_top_products(df: pd.DataFrame, top_n=50):
     """Treemap showing revenue nested by Product_Category > Product for top N products by revenue."""
     if df.empty or 'Product' not in df.columns:
         return px.treemap()
-    prod = df.groupby(['Product_Category', 'Product'], as_index=False)['Revenue'].sum()
-    top = prod.groupby('Product', as_index=False)['Revenue'].sum().sort_values('Revenue', ascending=False).head(top_n)
-    top_products = top['Product'].tolist()
-    prod = prod[prod['Product'].isin(top_products)]
+    # pick the top products in one O(n) pass, then only group their rows by category
+    top_products = top_k_sums(df, 'Product', 'Revenue', k=top_n)['Product']
+    subset = df.loc[df['Product'].isin(top_products), ['Product_Category', 'Product', 'Revenue']]
+    prod = subset.groupby(['Product_Category', 'Product'], as_index=False, observed=True)['Revenue'].sum()
     fig = px.treemap(prod, path=['Product_Category', 'Product'], values='Revenue', title=f'Treemap of Top {top_n} Products by Revenue', color='Revenue', color_continuous_scale=[PALETTE['dark'], PALETTE['primary']])
     fig.update_layout(plot_bgcolor='rgba(0,0,0,0)', paper_bgcolor='rgba(0,0,0,0)', font_color=PALETTE['accent'])
     return fig